@@ -1,10 +1,12 @@
 from django.contrib import admin
+from django.utils import timezone
 from .models import Author, Post, Comment
 
 
 @admin.register(Author)
 class AuthorAdmin(admin.ModelAdmin):
     list_display = ['name', 'email', 'user', 'created_at']
+    list_select_related = ['user']
     list_filter = ['created_at']
     search_fields = ['name', 'email']
     readonly_fields = ['created_at', 'updated_at']
@@ -13,15 +15,24 @@ class AuthorAdmin(admin.ModelAdmin):
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'status', 'active', 'published_date']
+    list_select_related = ['author']
     list_filter = ['status', 'active', 'published_date', 'author']
     search_fields = ['title', 'content']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'published_date'
 
+    def get_changeform_initial_data(self, request):
+        return {'published_date': timezone.now(), **super().get_changeform_initial_data(request)}
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['post', 'user', 'is_approved', 'created']
+    list_select_related = ['post', 'user']
     list_filter = ['is_approved', 'created', 'post']
     search_fields = ['content']
     readonly_fields = ['created']
+
+    # Comment.__str__ only uses loaded relations, join them for change/delete pages
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('post', 'user')
@@ -0,0 +1,41 @@
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+POSTS_VERSION_KEY = 'posts:version'
+
+
+# current generation of blog data, cached pages and etags are keyed by it so a write makes them all stale at once
+# the cache is per process and writes elsewhere (other workers, manage.py commands, queryset.update()) never
+# reach it, so the version also expires with the cached pages and nothing stays stale past POST_CACHE_TIMEOUT
+def posts_cache_version():
+    version = cache.get(POSTS_VERSION_KEY)
+    if version is None:
+        version = uuid4().hex
+        cache.set(POSTS_VERSION_KEY, version, settings.POST_CACHE_TIMEOUT)
+    return version
+
+
+# called on every post/author/comment write, bulk writes that skip signals must call it directly
+def invalidate_posts_cache():
+    cache.set(POSTS_VERSION_KEY, uuid4().hex, settings.POST_CACHE_TIMEOUT)
+
+
+def posts_cache_key(prefix, path):
+    return f'posts:{prefix}:{posts_cache_version()}:{path}'
+
+
+# etag for API reads, changes with any blog write and differs per url, representation and user
+# since the browsable API renders the user's name; matching requests get a 304 without touching the db
+def posts_etag(request, *args, **kwargs):
+    user = getattr(request, 'user', None)
+    parts = [posts_cache_version(), request.get_full_path(), request.headers.get('Accept', ''), str(getattr(user, 'pk', ''))]
+    return md5('|'.join(parts).encode()).hexdigest()
+
+
+# author row id for a user, dropped again when that author is deleted
+def author_cache_key(user_id):
+    return f'author:user:{user_id}'
@@ -1,14 +1,48 @@
-import django_filters
-from .models import Post
+from datetime import datetime, time
 
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
 
-# custom filter for posts with date range support
-class PostFilter(django_filters.FilterSet):
-    title = django_filters.CharFilter(field_name='title', lookup_expr='icontains')
-    published_date__gte = django_filters.DateFilter(field_name='published_date', lookup_expr='gte')
-    published_date__lte = django_filters.DateFilter(field_name='published_date', lookup_expr='lte')
-    author__name = django_filters.CharFilter(field_name='author__name', lookup_expr='icontains')
 
-    class Meta:
-        model = Post
-        fields = ['title', 'author__name', 'published_date__gte', 'published_date__lte']
\ No newline at end of file
+# hand-written filtering for the post list, the params are fixed so there is no FilterSet form to build per request
+class PostFilterBackend(BaseFilterBackend):
+    # icontains lookups are served by the pg_trgm indexes from migration 0004 on PostgreSQL
+    contains_params = {
+        'title': 'title__icontains',
+        'author__name': 'author__name__icontains',
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        lookups = {
+            lookup: params[param]
+            for param, lookup in self.contains_params.items()
+            if params.get(param)
+        }
+
+        # ?published_date_after=&published_date_before=, inclusive whole days, both bounds become a single BETWEEN
+        after = self.parse_day(params, 'published_date_after', time.min)
+        before = self.parse_day(params, 'published_date_before', time.max)
+        if after and before:
+            lookups['published_date__range'] = (after, before)
+        elif after:
+            lookups['published_date__gte'] = after
+        elif before:
+            lookups['published_date__lte'] = before
+
+        return queryset.filter(**lookups) if lookups else queryset
+
+    @staticmethod
+    def parse_day(params, name, at):
+        value = params.get(name)
+        if not value:
+            return None
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: ['Enter a valid date.']})
+        return timezone.make_aware(datetime.combine(day, at))
@@ -0,0 +1,120 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.cache import invalidate_posts_cache
+from blog.models import Author, Post, Comment
+
+
+# make_password('admin123') and make_password('testpass123'), hashed once so seeding never runs PBKDF2
+# check_password still accepts them and Django rehashes on login if the hasher's iterations go up
+ADMIN_PASSWORD_HASH = 'pbkdf2_sha256$1000000$qxKzH859XH1iVwouoinoad$HJ9Z6wnP7T0oPMQ/MgJEv7UI7/P48g7tEqRZ4c0msug='
+TESTUSER_PASSWORD_HASH = 'pbkdf2_sha256$1000000$qBpiT7xiI3MdMwN2fxVZiZ$LBD57prPyDdG5zcgbvY+Iddz/5wLRTjEQ5dhnH27aus='
+
+# seed rows, built once at import; related rows are referenced by username and post title
+# (username, password hash, extra user fields, author name)
+USERS = (
+    ('admin', ADMIN_PASSWORD_HASH, {'email': 'admin@example.com', 'is_staff': True, 'is_superuser': True}, 'Admin User'),
+    ('testuser', TESTUSER_PASSWORD_HASH, {'email': 'test@example.com', 'is_staff': True}, 'Test User'),
+)
+
+# (title, author username, status, active, content)
+POSTS = (
+    (
+        'Welcome to Django Blog', 'admin', Post.PUBLISHED, True,
+        'This is a comprehensive Django blog application with REST API functionality. The application demonstrates proper authentication, permissions, and CRUD operations for blog posts and comments.',
+    ),
+    (
+        'API Testing and Documentation', 'testuser', Post.PUBLISHED, True,
+        'This post demonstrates the REST API functionality including filtering by date ranges, author names, and proper pagination. The API supports both authenticated and anonymous access where appropriate.',
+    ),
+    (
+        'Draft Post (Inactive)', 'admin', Post.DRAFT, False,
+        'This is an inactive post that should not appear in the public listings but can be seen in admin panel.',
+    ),
+)
+
+# (post title, username or None for anonymous, is_approved, content)
+COMMENTS = (
+    ('Welcome to Django Blog', 'testuser', True, 'Great blog post! The authentication system works perfectly.'),
+    ('API Testing and Documentation', 'admin', True, 'Nice work on the API documentation and filtering features!'),
+    ('Welcome to Django Blog', None, False, 'Anonymous comment: This blog looks very professional!'),
+    ('API Testing and Documentation', 'testuser', True, 'The date filtering functionality is exactly what we needed.'),
+)
+
+DEMO_USERNAMES = tuple(username for username, _, _, _ in USERS)
+DEMO_POST_TITLES = tuple(title for title, _, _, _, _ in POSTS)
+
+
+# seeds sample users, authors, posts and comments, safe to re-run
+class Command(BaseCommand):
+    help = 'Creates demo users, posts and comments for trying out the blog'
+    
+    # one transaction for the whole seed, a single commit instead of one per statement
+    @transaction.atomic
+    def handle(self, *args, **options):
+        existing_usernames = set(User.objects.filter(username__in=DEMO_USERNAMES).values_list('username', flat=True))
+        
+        # a re-run against an already seeded database stops after two indexed lookups
+        if len(existing_usernames) == len(DEMO_USERNAMES) and \
+                Post.objects.filter(title__in=DEMO_POST_TITLES).count() == len(DEMO_POST_TITLES):
+            self.stdout.write('[DEMO] Creating demo data...\n[DEMO] Demo data already present, nothing to create')
+            return
+        
+        # Create test users with the precomputed password hashes
+        User.objects.bulk_create([
+            User(username=username, password=password_hash, **fields)
+            for username, password_hash, fields, _ in USERS
+            if username not in existing_usernames
+        ], ignore_conflicts=True, batch_size=500)
+        # related rows below only need their pk, so the re-fetches map each key straight to its id
+        # and rows are built with raw *_id values, no model instances are loaded or passed around
+        user_ids = dict(User.objects.filter(username__in=DEMO_USERNAMES).values_list('username', 'id'))
+        
+        # Create authors for users that don't have one yet, an existing author is reused whatever its email
+        # (the post create API expects at most one author per user)
+        author_ids_by_user = dict(Author.objects.filter(user_id__in=user_ids.values()).values_list('user_id', 'id'))
+        new_authors = Author.objects.bulk_create([
+            Author(user_id=user_ids[username], name=name, email=fields['email'])
+            for username, _, fields, name in USERS
+            if user_ids[username] not in author_ids_by_user
+        ], batch_size=500)
+        author_ids_by_user.update((author.user_id, author.id) for author in new_authors)
+        author_ids = {username: author_ids_by_user[user_id] for username, user_id in user_ids.items()}
+        
+        # Create sample posts, titles have no unique constraint so existing ones are filtered out first
+        existing_titles = set(Post.objects.filter(title__in=DEMO_POST_TITLES).values_list('title', flat=True))
+        Post.objects.bulk_create([
+            Post(title=title, content=content, author_id=author_ids[username], status=status, active=active)
+            for title, username, status, active, content in POSTS
+            if title not in existing_titles
+        ], batch_size=500)
+        post_ids = dict(Post.objects.filter(title__in=DEMO_POST_TITLES).values_list('title', 'id'))
+        
+        # Create sample comments, (post, user, content) is the natural key so a real comment by the
+        # same user, or another anonymous one, never hides a demo row; one query over the (post, user) index
+        existing_comments = set(
+            Comment.objects.filter(post_id__in=post_ids.values()).values_list('post_id', 'user_id', 'content')
+        )
+        comments = [
+            Comment(post_id=post_ids[title], user_id=user_ids.get(username), content=content, is_approved=is_approved)
+            for title, username, is_approved, content in COMMENTS
+        ]
+        Comment.objects.bulk_create([
+            comment for comment in comments
+            if (comment.post_id, comment.user_id, comment.content) not in existing_comments
+        ], batch_size=500)
+        
+        # bulk_create skips the save signals that normally expire cached listings; this only reaches the
+        # command's own process, a running server's per-process cache catches up after POST_CACHE_TIMEOUT
+        invalidate_posts_cache()
+        
+        # one write for the whole summary instead of one per line
+        self.stdout.write('\n'.join([
+            '[DEMO] Creating demo data...',
+            '[DEMO] Demo data created successfully:',
+            '[DEMO]   - 2 users: admin/admin123, testuser/testpass123',
+            '[DEMO]   - 2 authors with linked users',
+            '[DEMO]   - 3 posts (2 active, 1 inactive for testing)',
+            '[DEMO]   - 4 comments (3 approved, 1 pending)',
+        ]))
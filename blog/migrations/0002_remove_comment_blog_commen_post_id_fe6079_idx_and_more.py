@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 03:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='blog_commen_post_id_fe6079_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_status_02ce19_idx',
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations, models
+
+
+STATUS_CODES = {'draft': 0, 'published': 1}
+
+
+def status_to_code(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    for name, code in STATUS_CODES.items():
+        Post.objects.filter(status=name).update(status_code=code)
+
+
+def code_to_status(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    for name, code in STATUS_CODES.items():
+        Post.objects.filter(status_code=code).update(status=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_remove_comment_blog_commen_post_id_fe6079_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_status_294b3f_idx',
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        migrations.RemoveField(
+            model_name='post',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='post',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Draft'), (1, 'Published')], default=0),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', 'active'], name='blog_post_status_294b3f_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='post',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', [0, 1])), name='post_status_valid'),
+        ),
+    ]
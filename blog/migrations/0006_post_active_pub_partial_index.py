@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_status_valid'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_active_86db2c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('active', True)), fields=['-published_date'], name='post_active_pub'),
+        ),
+    ]
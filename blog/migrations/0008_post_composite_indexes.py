@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_db_default_timestamps'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_author__038a48_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='blog_post_status_294b3f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', 'active'], name='post_author_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['active', 'status', '-published_date'], name='post_active_pub_idx'),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
+from django.db.models.functions import Now
 from django.contrib.auth.models import User
-from django.utils import timezone
 
 
 # stores blog author information, links to django user with name/email
@@ -23,30 +23,52 @@ class Author(models.Model):
         return self.name
 
 
+# shared post querysets, keeps the author join in one place so views don't regress to N+1
+class PostQuerySet(models.QuerySet):
+    def with_author(self):
+        return self.select_related('author')
+    
+    def active_published(self):
+        return self.filter(active=True, status=Post.PUBLISHED)
+
+
 # main blog post model, handles title/content/status with author relationship
 class Post(models.Model):
+    # stored as a smallint to keep rows and the status/active index narrow
+    DRAFT = 0
+    PUBLISHED = 1
     STATUS_CHOICES = [
-        ('draft', 'Draft'),
-        ('published', 'Published'),
+        (DRAFT, 'Draft'),
+        (PUBLISHED, 'Published'),
     ]
     
     title = models.CharField(max_length=200)
     content = models.TextField()
-    published_date = models.DateTimeField(default=timezone.now)
+    published_date = models.DateTimeField(db_default=Now())
     author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='posts')
-    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
+    status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES, default=DRAFT)
     active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PostQuerySet.as_manager()
+    
     class Meta:
         db_table = 'blog_post'
         indexes = [
-            models.Index(fields=['author']),
-            models.Index(fields=['status']),
-            models.Index(fields=['active']),
+            # author filtering on active posts, author_id alone is already indexed by the FK
+            models.Index(fields=['author', 'active'], name='post_author_active_idx'),
             models.Index(fields=['published_date']),
-            models.Index(fields=['status', 'active']),  # compound index for filtering
+            # exact title lookups, e.g. the demo data seeding; the trigram indexes only cover icontains
+            models.Index(fields=['title']),
+            # web list/detail: equality on active and status, then read in newest-first order
+            models.Index(fields=['active', 'status', '-published_date'], name='post_active_pub_idx'),
+            # partial index matching the active=True newest-first list queries
+            models.Index(fields=['-published_date'], name='post_active_pub', condition=models.Q(active=True)),
+        ]
+        constraints = [
+            # enforced by the db so bulk inserts can skip full_clean; values are DRAFT, PUBLISHED
+            models.CheckConstraint(condition=models.Q(status__in=[0, 1]), name='post_status_valid'),
         ]
         ordering = ['-published_date']
     
@@ -59,19 +81,32 @@ class Comment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
     content = models.TextField()
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
-    created = models.DateTimeField(default=timezone.now)
+    created = models.DateTimeField(db_default=Now())
     is_approved = models.BooleanField(default=False)
     
     class Meta:
         db_table = 'blog_comment'
         indexes = [
-            models.Index(fields=['post']),
             models.Index(fields=['user']),
             models.Index(fields=['created']),
             models.Index(fields=['is_approved']),
             models.Index(fields=['post', 'is_approved']),  # for filtering approved comments per post
+            models.Index(fields=['post', 'user']),  # one comment per post and user lookups
         ]
         ordering = ['-created']
     
+    # only reads related rows that are already loaded, never triggers a query
     def __str__(self):
-        return f'Comment on "{self.post.title}" by {self.user.username if self.user else "Anonymous"}'
+        if self._meta.get_field('post').is_cached(self):
+            post_title = self.post.title
+        else:
+            post_title = f'#{self.post_id}'
+        
+        if self.user_id is None:
+            user_name = 'Anonymous'
+        elif self._meta.get_field('user').is_cached(self):
+            user_name = self.user.username
+        else:
+            user_name = f'user #{self.user_id}'
+        
+        return f'Comment on "{post_title}" by {user_name}'
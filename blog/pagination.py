@@ -0,0 +1,30 @@
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+from .cache import posts_cache_key
+
+
+# the COUNT(*) behind every page is cached per filtered query and expires with the posts cache,
+# page rows are still read live
+class CachedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+
+        key = posts_cache_key('count', md5(str(query).encode()).hexdigest())
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, settings.POST_CACHE_TIMEOUT)
+        return count
+
+
+class PostPagination(PageNumberPagination):
+    django_paginator_class = CachedCountPaginator
@@ -0,0 +1,14 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+# drop-in JSON renderer backed by orjson, much faster encoding for large list payloads
+# types orjson can't handle natively (lazy strings, Decimal, ...) go through DRF's encoder
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        # orjson only supports 2-space indents, used when the browsable API asks for indented output
+        option = orjson.OPT_INDENT_2 if self.get_indent(accepted_media_type, renderer_context or {}) else 0
+        return orjson.dumps(data, default=self.encoder_class().default, option=option)
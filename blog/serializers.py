@@ -1,30 +1,51 @@
+import copy
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import CharField, Count, Prefetch, Q, Value
+from django.db.models.functions import Coalesce
 from .models import Author, Post, Comment
 
 
+# builds the field set once per class instead of on every instantiation,
+# each instance binds its own shallow copies so no state is shared
+class CachedFieldsMixin:
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
 # basic author info for API responses, returns id/name/email
-class AuthorSerializer(serializers.ModelSerializer):
+class AuthorSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Author
         fields = ['id', 'name', 'email']
 
 
 # comment data when showing them in post details, includes username or anonymous
-class CommentSerializer(serializers.ModelSerializer):
-    user_name = serializers.SerializerMethodField()
+# user_name comes from the with_user_name() annotation, resolved in SQL
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    user_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = Comment
         fields = ['id', 'content', 'user', 'user_name', 'created', 'is_approved']
         read_only_fields = ['created', 'is_approved']
     
-    def get_user_name(self, obj):
-        return obj.user.username
+    @staticmethod
+    def with_user_name(queryset):
+        return queryset.annotate(
+            user_name=Coalesce('user__username', Value('Anonymous'), output_field=CharField())
+        )
 
 
 # lightweight version for post listings without heavy data, just title/content/author
-class PostListSerializer(serializers.ModelSerializer):
+class PostListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.name', read_only=True)
     
     class Meta:
@@ -35,12 +56,41 @@ class PostListSerializer(serializers.ModelSerializer):
 # full post details including all comments, everything for single view
 class PostDetailSerializer(serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.name', read_only=True)
+    status = serializers.SerializerMethodField()
+    approved_comment_count = serializers.IntegerField(read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
     
     class Meta:
         model = Post
         fields = ['id', 'title', 'content', 'published_date', 'author_name', 
-                 'status', 'active', 'comments']
+                 'status', 'active', 'approved_comment_count', 'comments']
+    
+    # a 'fields' entry in the context drops every field not listed
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get('fields')
+        if requested is not None:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+    
+    # status is stored as a smallint, keep returning 'draft'/'published'
+    def get_status(self, obj):
+        return obj.get_status_display().lower()
+    
+    # counts approved comments in the post query and loads comments with usernames in one
+    # extra query, each only when rendered; the author join is derived by AutoPrefetchMixin
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        if fields is None or 'approved_comment_count' in fields:
+            queryset = queryset.annotate(
+                approved_comment_count=Count('comments', filter=Q(comments__is_approved=True))
+            )
+        if fields is None or 'comments' in fields:
+            comments = CommentSerializer.with_user_name(
+                Comment.objects.only('id', 'content', 'user', 'created', 'is_approved', 'post')
+            )
+            queryset = queryset.prefetch_related(Prefetch('comments', queryset=comments))
+        return queryset
 
 
 # handles new post creation via API, accepts author name and creates author if needed
@@ -50,27 +100,35 @@ class PostCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Post
         fields = ['title', 'content', 'published_date', 'author_name']
+        # left out of the INSERT when omitted so the database default fills it
+        extra_kwargs = {'published_date': {'required': False}}
     
     def create(self, validated_data):
         author_name = validated_data.pop('author_name')
         
-        # Find or create author based on the authenticated user
-        user = self.context['request'].user
-        try:
-            author = Author.objects.get(user=user)
-            # Update author name if different
+        # Get or create the author for the authenticated user, the name is only written when it changed
+        request = self.context['request']
+        user = request.user
+        
+        # Authors resolved earlier in the same request are reused without a query
+        author_cache = getattr(request, '_author_cache', None)
+        if author_cache is None:
+            author_cache = request._author_cache = {}
+        
+        with transaction.atomic():
+            author = author_cache.get(user.id)
+            if author is None:
+                author, created = Author.objects.select_for_update().get_or_create(
+                    user=user,
+                    defaults={'name': author_name, 'email': user.email}
+                )
+                author_cache[user.id] = author
             if author.name != author_name:
                 author.name = author_name
-                author.save()
-        except Author.DoesNotExist:
-            author = Author.objects.create(
-                name=author_name,
-                email=user.email,
-                user=user
-            )
-        
-        validated_data['author'] = author
-        return Post.objects.create(**validated_data)
+                author.save(update_fields=['name', 'updated_at'])
+            
+            validated_data['author'] = author
+            return Post.objects.create(**validated_data)
 
 
 # editing posts restricts to safe fields only, title/content/active allowed
@@ -80,20 +138,18 @@ class PostUpdateSerializer(serializers.ModelSerializer):
         fields = ['title', 'content', 'active']
 
 
-# new comment submissions, validates post is active before creating
+# new comment submissions, only active posts can be looked up so inactive ones fail validation
 class CommentCreateSerializer(serializers.ModelSerializer):
+    post = serializers.PrimaryKeyRelatedField(
+        queryset=Post.objects.filter(active=True).only('id'),
+        error_messages={'does_not_exist': "Comments can only be created on active posts."}
+    )
+    
     class Meta:
         model = Comment
         fields = ['post', 'content', 'user']
         read_only_fields = ['user']
     
-    def validate_post(self, value):
-        if not value.active:
-            raise serializers.ValidationError(
-                "Comments can only be created on active posts."
-            )
-        return value
-    
     def create(self, validated_data):
         # Set user from request context (authentication is required)
         request = self.context.get('request')
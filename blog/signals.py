@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import author_cache_key, invalidate_posts_cache
+from .models import Author, Comment, Post
+
+
+# any change to data shown in post listings expires the cached pages
+@receiver([post_save, post_delete], sender=Post)
+@receiver([post_save, post_delete], sender=Author)
+@receiver([post_save, post_delete], sender=Comment)
+def expire_post_caches(sender, **kwargs):
+    invalidate_posts_cache()
+
+
+# a deleted author's id must not be handed out to new posts
+@receiver(post_delete, sender=Author)
+def forget_author_id(sender, instance, **kwargs):
+    cache.delete(author_cache_key(instance.user_id))
+
+
+# remembers who owned an author before a save that may reassign it, saves that only touch
+# other columns (e.g. the name sync on post create) skip the lookup
+@receiver(pre_save, sender=Author)
+def remember_author_user(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields is not None and not {'user', 'user_id'} & set(update_fields)):
+        return
+    instance._previous_user_id = Author.objects.filter(pk=instance.pk).values_list('user_id', flat=True).first()
+
+
+# an author moved to another user must not keep being handed to its previous user's new posts
+@receiver(post_save, sender=Author)
+def forget_reassigned_author_id(sender, instance, **kwargs):
+    previous_user_id = instance.__dict__.pop('_previous_user_id', instance.user_id)
+    if previous_user_id != instance.user_id:
+        cache.delete(author_cache_key(previous_user_id))
@@ -0,0 +1,72 @@
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from blog.models import Author
+
+
+# the fixture password is hashed once at import instead of once per create_user call
+_TESTPASS = 'testpass123'
+_TESTPASS_HASH = make_password(_TESTPASS)
+
+
+# password=None stores an unusable password, for users that are only ever force-authenticated
+def _fast_user(username, email, password=None):
+    stored = _TESTPASS_HASH if password == _TESTPASS else make_password(password)
+    return User.objects.create(username=username, email=email, password=stored)
+
+
+# one reference time for the whole run, keeps date-relative fixtures and filters consistent
+@pytest.fixture(scope='session')
+def now():
+    return timezone.now()
+
+
+# created once per test module outside the per-test transaction, removed again on teardown
+# tests must not mutate these instances, changes made through the db are rolled back per test
+@pytest.fixture(scope='module')
+def user(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        user = _fast_user(
+            username='testuser', 
+            email='test@example.com', 
+            password=_TESTPASS
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope='module')
+def author(user, django_db_blocker):
+    with django_db_blocker.unblock():
+        author = Author.objects.create(
+            name='Test Author',
+            email=user.email,
+            user=user
+        )
+    yield author
+    with django_db_blocker.unblock():
+        author.delete()
+
+
+# a second account for ownership checks, shared by the non-owner tests
+# it never logs in, force_authenticate skips the password entirely
+@pytest.fixture(scope='module')
+def other_user(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        other_user = _fast_user(
+            username='other',
+            email='other@test.com'
+        )
+    yield other_user
+    with django_db_blocker.unblock():
+        other_user.delete()
+
+
+# pytest-django appends the xdist worker id to the test database name, which would land inside the
+# sqlite URI's query string. in-memory databases are already private to each worker process, so skip it
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings_xdist_suffix():
+    pass
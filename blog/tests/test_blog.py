@@ -1,251 +1,464 @@
 import pytest
 import json
-from datetime import datetime, timedelta
-from django.utils import timezone
+import logging
+import time
+from collections import namedtuple
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache.backends import locmem
+from django.core.management import call_command
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from django.core.cache import cache
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APIClient
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
+from blog.management.commands.create_demo_data import DEMO_POST_TITLES, DEMO_USERNAMES
 from blog.models import Author, Post, Comment
+from blog.pagination import PostPagination
+from blog.renderers import ORJSONRenderer
+from blog.serializers import CommentSerializer, PostCreateSerializer, PostDetailSerializer, PostListSerializer
+from blog.views import related_lookups
 
 
-@pytest.fixture
-def user():
-    return User.objects.create_user(
-        username='testuser', 
-        email='test@example.com', 
-        password='testpass123'
-    )
+logger = logging.getLogger(__name__)
 
+# web urls resolved once at import rather than in every test
+POST_LIST_URL = reverse('blog:post_list')
+POST_CREATE_URL = reverse('blog:post_create')
 
-@pytest.fixture
-def author(user):
-    return Author.objects.create(
-        name='Test Author',
-        email=user.email,
-        user=user
-    )
 
-
-@pytest.fixture
-def active_post(author):
-    return Post.objects.create(
-        title='Active Post',
-        content='This is an active post content',
-        author=author,
-        status='published',
-        active=True,
-        published_date=timezone.now()
-    )
+# defers json.dumps until a debug record is actually emitted
+class _Pretty:
+    def __init__(self, data):
+        self.data = data
+    
+    def __str__(self):
+        return json.dumps(self.data, indent=2)
+
+
+PostBundle = namedtuple('PostBundle', ['active', 'inactive', 'old'])
+
+
+# inserts all three sample posts in a single bulk INSERT, once per module
+# edit/delete tests run inside pytest-django's per-test transaction so their changes roll back
+@pytest.fixture(scope='module')
+def posts(author, now, django_db_blocker):
+    with django_db_blocker.unblock():
+        created = Post.objects.bulk_create([
+            Post(
+                title='Active Post',
+                content='This is an active post content',
+                author=author,
+                status=Post.PUBLISHED,
+                active=True,
+                published_date=now
+            ),
+            Post(
+                title='Inactive Post', 
+                content='This post is inactive',
+                author=author,
+                status=Post.PUBLISHED,
+                active=False,
+                published_date=now
+            ),
+            Post(
+                title='Old Post',
+                content='This is an old post',
+                author=author,
+                status=Post.PUBLISHED,
+                active=True,
+                published_date=now - timedelta(days=30)
+            ),
+        ], batch_size=500)
+    yield PostBundle(*created)
+    with django_db_blocker.unblock():
+        Post.objects.filter(pk__in=[post.pk for post in created]).delete()
+
+
+# most tests only need the one active post, the rest index into the posts bundle
+@pytest.fixture(scope='module')
+def active_post(posts):
+    return posts.active
 
 
 @pytest.fixture
-def inactive_post(author):
-    return Post.objects.create(
-        title='Inactive Post', 
-        content='This post is inactive',
-        author=author,
-        status='published',
-        active=False,
-        published_date=timezone.now()
-    )
+def api_client():
+    return APIClient()
 
 
+# api client already authenticated as the module's test user
 @pytest.fixture
-def old_post(author):
-    old_date = timezone.now() - timedelta(days=30)
-    return Post.objects.create(
-        title='Old Post',
-        content='This is an old post',
-        author=author,
-        status='published',
-        active=True,
-        published_date=old_date
-    )
+def auth_client(api_client, user):
+    api_client.force_authenticate(user=user)
+    return api_client
 
 
-@pytest.fixture
-def api_client():
-    return APIClient()
+# cached listings must not leak between tests, bulk-created fixtures don't fire invalidation signals
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
 
 
 @pytest.mark.django_db
 class TestPostListView:
     
-    def test_post_list_shows_only_active_posts(self, active_post, inactive_post):
-        from django.test import Client
-        
-        print(f"\n{'='*60}")
-        print(f"[TEST] Web View - Active Posts Only")
-        print(f"{'='*60}")
-        print(f"**GET** `/posts/` (Django ListView)")
-        print(f"Testing that only active posts appear in web template")
+    def test_post_list_shows_only_active_posts(self, client, posts):
+        logger.debug("[TEST] Web View - Active Posts Only")
+        logger.debug("**GET** `/posts/` (Django ListView)")
+        logger.debug("Testing that only active posts appear in web template")
         
-        client = Client()
-        response = client.get(reverse('blog:post_list'))
+        response = client.get(POST_LIST_URL)
         
-        print(f"\nResponse Status: {response.status_code}")
-        print(f"[SHOULD APPEAR] Active post '{active_post.title}' - active: {active_post.active}")
-        print(f"[SHOULD NOT APPEAR] Inactive post '{inactive_post.title}' - active: {inactive_post.active}")
+        logger.debug("Response Status: %s", response.status_code)
+        logger.debug("[SHOULD APPEAR] Active post '%s' - active: %s", posts.active.title, posts.active.active)
+        logger.debug("[SHOULD NOT APPEAR] Inactive post '%s' - active: %s", posts.inactive.title, posts.inactive.active)
         
         assert response.status_code == 200, "Post list page should load successfully"
         
-        content = response.content.decode()
-        active_in_content = active_post.title in content
-        inactive_in_content = inactive_post.title in content
+        # check the posts handed to the template rather than scanning the rendered page
+        listed = list(response.context['posts'])
+        active_in_content = posts.active in listed
+        inactive_in_content = posts.inactive in listed
         
-        print(f"\nContent Analysis:")
-        print(f"[FOUND] Active post found in HTML: {active_in_content}")
-        print(f"[NOT FOUND] Inactive post found in HTML: {inactive_in_content}")
+        logger.debug("Context Analysis:")
+        logger.debug("[FOUND] Active post in template context: %s", active_in_content)
+        logger.debug("[NOT FOUND] Inactive post in template context: %s", inactive_in_content)
         
         assert active_in_content, "Active post should appear in the list"
         assert not inactive_in_content, "Inactive post should not appear in the list"
         
-        print(f"\n[SUCCESS] Web view correctly shows only active posts")
+        logger.debug("[SUCCESS] Web view correctly shows only active posts")
     
-    def test_api_post_list_shows_only_active_posts(self, api_client, active_post, inactive_post):
-        print(f"\n{'='*60}")
-        print(f"[TEST 1] API - Active Posts Only")
-        print(f"{'='*60}")
-        print(f"**GET** `/api/posts/`")
+    def test_post_list_cached_for_anonymous_until_posts_change(self, client, active_post, django_assert_num_queries):
+        client.get(POST_LIST_URL)
         
-        response = api_client.get('/api/posts/')
+        with django_assert_num_queries(0):
+            cached = client.get(POST_LIST_URL)
+        
+        logger.debug("[TEST] Cached page served without queries: %s", cached.status_code)
+        assert active_post.title.encode() in cached.content, "Cached page should contain the post"
+        
+        Post.objects.create(title='Fresh Post', content='New content', author=active_post.author, status=Post.PUBLISHED)
+        refreshed = client.get(POST_LIST_URL)
+        
+        logger.debug("[TEST] Fresh post visible after write: %s", b'Fresh Post' in refreshed.content)
+        assert b'Fresh Post' in refreshed.content, "Saving a post should expire the cached page"
+        
+        logger.debug("[TEST] ✓ Anonymous list page cached and invalidated on writes")
+    
+    def test_api_post_list_cached_for_anonymous_until_posts_change(self, api_client, active_post, django_assert_num_queries):
+        api_client.get('/api/posts/?ordering=title&search=Post')
+        
+        # same params in a different order hit the same entry
+        with django_assert_num_queries(0):
+            cached = api_client.get('/api/posts/?search=Post&ordering=title')
+        
+        titles = [post['title'] for post in cached.json()['results']]
+        logger.debug("[TEST] Cached API titles: %s", titles)
+        assert active_post.title in titles, "Cached response should contain the post"
+        
+        Post.objects.create(title='Fresh Post', content='New content', author=active_post.author, status=Post.PUBLISHED)
+        refreshed = [post['title'] for post in api_client.get('/api/posts/?search=Post&ordering=title').json()['results']]
+        
+        assert 'Fresh Post' in refreshed, "Saving a post should expire the cached API response"
+        
+        logger.debug("[TEST] ✓ Anonymous API list cached and invalidated on writes")
+    
+    def test_api_post_list_cache_keyed_by_host(self, api_client, posts, settings, monkeypatch):
+        settings.ALLOWED_HOSTS = ['testserver', 'public.example']
+        monkeypatch.setattr(PostPagination, 'page_size', 1)
+        
+        api_client.get('/api/posts/')
+        response = api_client.get('/api/posts/', HTTP_HOST='public.example')
         
-        print(f"\nResponse Status: {response.status_code}")
-        print(f"[SHOULD APPEAR] Active post '{active_post.title}' - active: {active_post.active}")
-        print(f"[SHOULD NOT APPEAR] Inactive post '{inactive_post.title}' - active: {inactive_post.active}")
+        logger.debug("[TEST] Next link for second host: %s", response.json()['next'])
+        assert response.json()['next'].startswith('http://public.example/'), "Page links should use the requesting host"
+        
+        logger.debug("[TEST] ✓ Cached API pages keep per-host links")
+    
+    def test_api_post_list_count_cached_between_pages(self, auth_client, posts, django_assert_num_queries):
+        # authenticated requests skip the response cache, only the page count is reused
+        first = auth_client.get('/api/posts/')
+        
+        with django_assert_num_queries(1):
+            second = auth_client.get('/api/posts/')
+        
+        logger.debug("[TEST] Counts: %s / %s", first.json()['count'], second.json()['count'])
+        assert second.json()['count'] == first.json()['count'], "Cached count should match the live count"
+        
+        Post.objects.create(title='Fresh Post', content='New content', author=posts.active.author, status=Post.PUBLISHED)
+        
+        assert auth_client.get('/api/posts/').json()['count'] == first.json()['count'] + 1, "Saving a post should expire the cached count"
+        
+        logger.debug("[TEST] ✓ List count cached until posts change")
+    
+    def test_api_post_list_shows_only_active_posts(self, api_client, posts, django_assert_num_queries):
+        logger.debug("[TEST 1] API - Active Posts Only")
+        logger.debug("**GET** `/api/posts/`")
+        
+        # page count plus one select with the author joined, independent of the number of posts
+        with django_assert_num_queries(2):
+            response = api_client.get('/api/posts/')
+        
+        logger.debug("Response Status: %s", response.status_code)
+        logger.debug("[SHOULD APPEAR] Active post '%s' - active: %s", posts.active.title, posts.active.active)
+        logger.debug("[SHOULD NOT APPEAR] Inactive post '%s' - active: %s", posts.inactive.title, posts.inactive.active)
         
         assert response.status_code == 200, "API should return success status"
         
-        print(f"\nAPI Response JSON:")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        logger.debug("API Response JSON:\n%s", _Pretty(response.data))
         
-        titles = [post['title'] for post in response.data['results']]
+        titles = [post['title'] for post in response.json()['results']]
         
-        assert active_post.title in titles, "Active post should be in API response"
-        assert inactive_post.title not in titles, "Inactive post should not be in API response"
+        assert posts.active.title in titles, "Active post should be in API response"
+        assert posts.inactive.title not in titles, "Inactive post should not be in API response"
         
-        print(f"\n[EXCLUDED] Inactive post '{inactive_post.title}' NOT in results")
-        print(f"\n[SUCCESS] API correctly filters to active posts only")
+        logger.debug("[EXCLUDED] Inactive post '%s' NOT in results", posts.inactive.title)
+        logger.debug("[SUCCESS] API correctly filters to active posts only")
 
 
 @pytest.mark.django_db  
 class TestPostListFiltering:
     
-    def test_api_post_list_date_range_filtering(self, api_client, active_post, old_post):
-        recent_date = (timezone.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+    def test_api_post_list_without_params_uses_default_ordering(self, api_client, posts, now):
+        # inserted last but published latest, so only the ordering can put it first
+        Post.objects.create(title='Newest Post', content='Newest', author=posts.active.author,
+                            status=Post.PUBLISHED, published_date=now + timedelta(days=1))
+        
+        response = api_client.get('/api/posts/')
+        
+        titles = [post['title'] for post in response.json()['results']]
+        logger.debug("[TEST] Unfiltered list order: %s", titles)
+        
+        assert titles[0] == 'Newest Post', "Unfiltered list should be newest first"
+        assert titles.index(posts.active.title) < titles.index(posts.old.title), "Unfiltered list should be newest first"
+        
+        logger.debug("[TEST] ✓ Unfiltered list keeps the default ordering")
+    
+    def test_api_post_list_date_range_filtering(self, api_client, posts, now):
+        recent_date = (now - timedelta(days=7)).date().isoformat()
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 2] API - Date Range Filter")
-        print(f"{'='*60}")
-        print(f"**GET** `/api/posts/?published_date__gte={recent_date}`")
+        logger.debug("[TEST 2] API - Date Range Filter")
+        logger.debug("**GET** `/api/posts/?published_date_after=%s`", recent_date)
         
-        print(f"\nTest Data:")
-        print(f"[RECENT] Recent post '{active_post.title}' published: {active_post.published_date.strftime('%Y-%m-%d')}")
-        print(f"[OLD] Old post '{old_post.title}' published: {old_post.published_date.strftime('%Y-%m-%d')}")
-        print(f"[FILTER] Posts >= {recent_date}")
+        logger.debug("Test Data:")
+        # date objects format as YYYY-MM-DD through %s, only when the record is emitted
+        logger.debug("[RECENT] Recent post '%s' published: %s", posts.active.title, posts.active.published_date.date())
+        logger.debug("[OLD] Old post '%s' published: %s", posts.old.title, posts.old.published_date.date())
+        logger.debug("[FILTER] Posts >= %s", recent_date)
         
-        response = api_client.get(f'/api/posts/?published_date__gte={recent_date}')
+        response = api_client.get(f'/api/posts/?published_date_after={recent_date}')
         
-        print(f"\nResponse Status: {response.status_code}")
+        logger.debug("Response Status: %s", response.status_code)
         
         assert response.status_code == 200, "Filtered API request should succeed"
         
-        print(f"\nAPI Response JSON:")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        logger.debug("API Response JSON:\n%s", _Pretty(response.data))
+        
+        titles = [post['title'] for post in response.json()['results']]
+        
+        assert posts.active.title in titles, "Recent post should appear in date-filtered results"
+        assert posts.old.title not in titles, "Old post should not appear in recent date filter"
+        
+        logger.debug("[INCLUDED] Recent post included")
+        logger.debug("[EXCLUDED] Old post excluded")
+        logger.debug("[SUCCESS] Date range filtering works correctly")
+    
+    def test_api_post_list_bounded_date_range_filtering(self, api_client, posts, now):
+        start_date = (now - timedelta(days=40)).date().isoformat()
+        end_date = (now - timedelta(days=20)).date().isoformat()
         
-        titles = [post['title'] for post in response.data['results']]
+        logger.debug("[TEST] Filtering posts between %s and %s", start_date, end_date)
         
-        assert active_post.title in titles, "Recent post should appear in date-filtered results"
-        assert old_post.title not in titles, "Old post should not appear in recent date filter"
+        response = api_client.get(f'/api/posts/?published_date_after={start_date}&published_date_before={end_date}')
         
-        print(f"\n[INCLUDED] Recent post included")
-        print(f"[EXCLUDED] Old post excluded")
-        print(f"\n[SUCCESS] Date range filtering works correctly")
+        logger.debug("[TEST] Bounded date filter API Response Status: %s", response.status_code)
         
-    def test_api_post_list_author_filtering(self, api_client, active_post):
-        print(f"\n{'='*60}")
-        print(f"[TEST 3] API - Author Filter")
-        print(f"{'='*60}")
-        print(f"**GET** `/api/posts/?author__name={active_post.author.name}`")
+        assert response.status_code == 200, "Bounded date range request should succeed"
         
-        print(f"\nTest Data:")
-        print(f"[AUTHOR] Filtering by author: '{active_post.author.name}'")
+        titles = [post['title'] for post in response.json()['results']]
+        
+        assert posts.old.title in titles, "Post inside the range should appear"
+        assert posts.active.title not in titles, "Post after the range should not appear"
+        
+        logger.debug("[TEST] ✓ Bounded date range filtering works correctly")
+        
+    def test_api_post_list_invalid_date_rejected(self, api_client):
+        response = api_client.get('/api/posts/?published_date_after=2025-02-30')
+        
+        logger.debug("[TEST] Invalid date response: %s %s", response.status_code, response.json())
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Invalid dates should be rejected"
+        assert 'published_date_after' in response.json(), "Error should name the bad parameter"
+    
+    def test_api_post_list_author_filtering(self, api_client, active_post, django_assert_num_queries):
+        logger.debug("[TEST 3] API - Author Filter")
+        logger.debug("**GET** `/api/posts/?author__name=%s`", active_post.author.name)
         
-        response = api_client.get(f'/api/posts/?author__name={active_post.author.name}')
+        logger.debug("Test Data:")
+        logger.debug("[AUTHOR] Filtering by author: '%s'", active_post.author.name)
         
-        print(f"\nResponse Status: {response.status_code}")
+        with django_assert_num_queries(2):
+            response = api_client.get(f'/api/posts/?author__name={active_post.author.name}')
+        
+        logger.debug("Response Status: %s", response.status_code)
         
         assert response.status_code == 200, "Author filtering should work"
-        assert len(response.data['results']) >= 1, "Should return posts by the specified author"
         
-        print(f"\nAPI Response JSON:")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        results = response.json()['results']
+        assert len(results) >= 1, "Should return posts by the specified author"
+        
+        logger.debug("API Response JSON:\n%s", _Pretty(response.data))
         
-        if response.data['results']:
-            assert response.data['results'][0]['author_name'] == active_post.author.name, "Returned post should match author filter"
+        assert results[0]['author_name'] == active_post.author.name, "Returned post should match author filter"
         
-        print(f"\n[SUCCESS] Author filtering works correctly")
+        logger.debug("[SUCCESS] Author filtering works correctly")
 
 
 @pytest.mark.django_db
 class TestPostCreationAPI:
     
-    def test_authenticated_user_can_create_post(self, api_client, user):
-        api_client.force_authenticate(user=user)
-        
+    # other_user never has an author, so this always takes the create-author path
+    def test_authenticated_user_can_create_post(self, api_client, other_user, now, django_assert_num_queries):
+        api_client.force_authenticate(user=other_user)
         post_data = {
             'title': 'New Test Post',
             'content': 'This is a test post created via API',
             'author_name': 'API Test Author',
-            'published_date': timezone.now().isoformat()
+            'published_date': now.isoformat()
         }
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 4] API - Create Post (Authenticated)")
-        print(f"{'='*60}")
-        print(f"**POST** `/api/posts/`")
-        print(f"[AUTH] Authenticated as: {user.username}")
+        logger.debug("[TEST 4] API - Create Post (Authenticated)")
+        logger.debug("**POST** `/api/posts/`")
+        logger.debug("[AUTH] Authenticated as: %s", other_user.username)
         
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(post_data, indent=2))
-        print("```")
+        logger.debug("Request JSON:\n%s", _Pretty(post_data))
         
-        response = api_client.post('/api/posts/', post_data, format='json')
+        # author lookup, author insert and post insert, plus a savepoint pair around each atomic block
+        with django_assert_num_queries(7):
+            response = api_client.post('/api/posts/', post_data, format='json')
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 201 else '[FAIL]'}")
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 201 else '[FAIL]')
         
         if response.status_code == status.HTTP_201_CREATED:
-            print(f"\nResponse JSON (201 Created):")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
+            logger.debug("Response JSON (201 Created):\n%s", _Pretty(response.data))
         else:
-            print(f"\nError Response:")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
+            logger.debug("Error Response:\n%s", _Pretty(response.data))
         
         assert response.status_code == status.HTTP_201_CREATED, f"Post creation should succeed, got {response.status_code}: {response.data}"
         
-        created_post = Post.objects.get(title='New Test Post')
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Post content matches: {created_post.content == post_data['content']}")
-        print(f"[VERIFY] Author name: '{created_post.author.name}'")
-        print(f"[VERIFY] Author linked to user: {created_post.author.user == user}")
+        # one query: content plus the joined author's name and user id
+        created_post = Post.objects.select_related('author').only('content', 'author__name', 'author__user').get(title='New Test Post')
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Post content matches: %s", created_post.content == post_data['content'])
+        logger.debug("[VERIFY] Author name: '%s'", created_post.author.name)
+        logger.debug("[VERIFY] Author linked to user: %s", created_post.author.user_id == other_user.id)
         
         assert created_post.content == post_data['content'], "Post content should match submitted data"
         assert created_post.author.name == 'API Test Author', "Author should be created or linked correctly"
-        assert created_post.author.user == user, "Author should be linked to the authenticated user"
+        assert created_post.author.user_id == other_user.id, "Author should be linked to the authenticated user"
+        
+        logger.debug("[SUCCESS] Authenticated user can create posts successfully")
+    
+    def test_create_post_as_existing_author(self, auth_client, user, author, django_assert_num_queries):
+        post_data = {'title': 'Existing Author Post', 'content': 'Posted by a known author', 'author_name': author.name}
+        
+        # author lookup and post insert inside one savepoint, the unchanged author is not written back
+        with django_assert_num_queries(4):
+            response = auth_client.post('/api/posts/', post_data, format='json')
+        
+        assert response.status_code == status.HTTP_201_CREATED, f"Post creation should succeed, got {response.status_code}: {response.data}"
+        assert Post.objects.filter(title='Existing Author Post', author=author).exists(), "Post should be linked to the existing author"
+        
+        logger.debug("[TEST] ✓ Existing author posts with a fixed query count")
+    
+    def test_create_post_reuses_existing_author(self, auth_client, user, author):
+        post_data = {
+            'title': 'Renamed Author Post',
+            'content': 'Post created by a user who already has an author profile',
+            'author_name': 'Renamed Author'
+        }
+        
+        logger.debug("[TEST] Creating post as existing author: '%s'", author.name)
+        
+        response = auth_client.post('/api/posts/', post_data, format='json')
+        
+        logger.debug("[TEST] Post creation API Response Status: %s", response.status_code)
+        
+        assert response.status_code == status.HTTP_201_CREATED, f"Post creation should succeed, got {response.status_code}: {response.data}"
+        assert Author.objects.filter(user=user).count() == 1, "Existing author should be reused, not duplicated"
+        
+        author_name = Author.objects.values_list('name', flat=True).get(pk=author.pk)
+        logger.debug("[TEST] Author name: '%s'", author_name)
+        assert author_name == 'Renamed Author', "Author name should be updated to the submitted name"
+        assert Post.objects.filter(title='Renamed Author Post', author=author).exists(), "Post should be linked to the existing author"
+        
+        logger.debug("[TEST] ✓ Existing author profile reused and renamed")
+    
+    def test_create_post_does_not_rewrite_unchanged_author(self, auth_client, author):
+        post_data = {'title': 'Same Author Post', 'content': 'Author name unchanged', 'author_name': author.name}
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_client.post('/api/posts/', post_data, format='json')
+        
+        updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+        logger.debug("[TEST] Updates on create: %s", updates)
+        
+        assert response.status_code == status.HTTP_201_CREATED, f"Post creation should succeed, got {response.status_code}: {response.data}"
+        assert not updates, "An unchanged author should not be written back"
         
-        print(f"\n[SUCCESS] Authenticated user can create posts successfully")
+        logger.debug("[TEST] ✓ Unchanged author left untouched")
+    
+    def test_create_post_without_published_date_uses_database_default(self, auth_client):
+        before = timezone.now()
+        response = auth_client.post('/api/posts/', {
+            'title': 'Default Date Post',
+            'content': 'Post created without a published date',
+            'author_name': 'Default Date Author'
+        }, format='json')
+        
+        logger.debug("[TEST] Post creation API Response Status: %s", response.status_code)
+        
+        assert response.status_code == status.HTTP_201_CREATED, f"Post creation should succeed, got {response.status_code}: {response.data}"
+        assert response.data['published_date'] is not None, "Database default should be returned after insert"
+        
+        published_date = Post.objects.values_list('published_date', flat=True).get(title='Default Date Post')
+        logger.debug("[TEST] Published date set by database: %s", published_date)
+        assert published_date >= before.replace(microsecond=0), "Published date should default to the insert time"
+        
+        logger.debug("[TEST] ✓ Published date defaults in the database")
+    
+    def test_author_lookup_cached_within_request(self, user):
+        request = Request(APIRequestFactory().post('/api/posts/'))
+        request.user = user
+        
+        def create_post(title):
+            serializer = PostCreateSerializer(
+                data={'title': title, 'content': 'Batch content', 'author_name': 'Batch Author'},
+                context={'request': request}
+            )
+            assert serializer.is_valid(), serializer.errors
+            return serializer.save()
+        
+        first = create_post('Batch Post 1')
+        with CaptureQueriesContext(connection) as queries:
+            second = create_post('Batch Post 2')
+        
+        author_queries = [q['sql'] for q in queries.captured_queries if 'blog_author' in q['sql']]
+        logger.debug("[TEST] Author queries on second create: %s", len(author_queries))
+        
+        assert second.author == first.author, "Both posts should share the same author"
+        assert not author_queries, "Second create in the same request should reuse the cached author"
+        
+        logger.debug("[TEST] ✓ Author resolved once per request")
     
     def test_unauthenticated_user_cannot_create_post(self, api_client):
         post_data = {
@@ -254,227 +467,207 @@ class TestPostCreationAPI:
             'author_name': 'Unauthorized User'
         }
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 5] API - Create Post (Unauthenticated)")
-        print(f"{'='*60}")
-        print(f"**POST** `/api/posts/` (No Authentication)")
-        print(f"[SECURITY] Testing security: Unauthenticated access")
+        logger.debug("[TEST 5] API - Create Post (Unauthenticated)")
+        logger.debug("**POST** `/api/posts/` (No Authentication)")
+        logger.debug("[SECURITY] Testing security: Unauthenticated access")
         
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(post_data, indent=2))
-        print("```")
+        logger.debug("Request JSON:\n%s", _Pretty(post_data))
         
         response = api_client.post('/api/posts/', post_data, format='json')
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 403 else '[FAIL]'}")
-        print(f"Expected: 403 Forbidden")
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 403 else '[FAIL]')
+        logger.debug("Expected: 403 Forbidden")
         
-        print(f"\nResponse JSON (403 Forbidden):")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        logger.debug("Response JSON (403 Forbidden):\n%s", _Pretty(response.data))
         
         assert response.status_code == status.HTTP_403_FORBIDDEN, "Unauthenticated users should not be able to create posts"
         
         post_exists = Post.objects.filter(title='Unauthorized Post').exists()
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Post NOT created in database: {not post_exists}")
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Post NOT created in database: %s", not post_exists)
         assert not post_exists, "Post should not be created without authentication"
         
-        print(f"\n[SUCCESS] Unauthenticated users correctly blocked from creating posts")
+        logger.debug("[SUCCESS] Unauthenticated users correctly blocked from creating posts")
 
 
 @pytest.mark.django_db
-class TestPostEditingAPI:
+class TestPostCreateView:
     
-    def test_author_can_edit_own_post(self, api_client, user, active_post):
-        api_client.force_authenticate(user=user)
+    def test_author_id_cached_between_submissions(self, client, user):
+        client.force_login(user)
+        form_data = {'title': 'Web Post', 'content': 'Written in the form', 'published_date': '2025-01-01 10:00'}
         
-        update_data = {
-            'title': 'Updated Post Title',
-            'content': 'Updated post content',
-            'active': False
-        }
+        first = client.post(POST_CREATE_URL, form_data)
+        assert first.status_code == 302, "Form submission should redirect to the list"
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 6] API - Edit Post (Owner)")
-        print(f"{'='*60}")
-        print(f"**PATCH** `/api/posts/{active_post.id}/edit/`")
-        print(f"[AUTH] Authenticated as: {user.username} (post owner)")
+        with CaptureQueriesContext(connection) as queries:
+            second = client.post(POST_CREATE_URL, {**form_data, 'title': 'Second Web Post'})
         
-        print(f"\nOriginal Post:")
-        print(f"[ORIGINAL] Title: '{active_post.title}'")
-        print(f"[ORIGINAL] Active: {active_post.active}")
+        author_queries = [query['sql'] for query in queries.captured_queries if 'FROM "blog_author"' in query['sql']]
+        logger.debug("[TEST] Author lookups on second submission: %s", author_queries)
         
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(update_data, indent=2))
-        print("```")
+        assert second.status_code == 302, "Second submission should redirect to the list"
+        assert not author_queries, "Cached author id should skip the author lookup"
+        assert Post.objects.filter(title='Second Web Post', author__user=user).exists(), "Post should belong to the user's author"
         
-        response = api_client.patch(f'/api/posts/{active_post.id}/edit/', update_data, format='json')
+        logger.debug("[TEST] ✓ Web form reuses the cached author id")
+    
+    def test_cached_author_id_forgotten_when_author_reassigned(self, client, user, other_user):
+        client.force_login(user)
+        form_data = {'title': 'Web Post', 'content': 'Written in the form', 'published_date': '2025-01-01 10:00'}
+        client.post(POST_CREATE_URL, form_data)
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 200 else '[FAIL]'}")
+        # e.g. an admin edit moving the author to another account
+        author = Author.objects.get(user=user)
+        author.user, author.email = other_user, other_user.email
+        author.save()
         
-        if response.status_code == status.HTTP_200_OK:
-            print(f"\nResponse JSON (200 OK):")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
-        else:
-            print(f"\nError Response:")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
+        client.post(POST_CREATE_URL, {**form_data, 'title': 'After Reassign'})
         
-        assert response.status_code == status.HTTP_200_OK, f"Post update should succeed, got {response.status_code}: {response.data}"
+        owner_id = Post.objects.values_list('author__user_id', flat=True).get(title='After Reassign')
+        logger.debug("[TEST] Post owner after reassignment: %s", owner_id)
+        assert owner_id == user.id, "New posts should not be attributed to the reassigned author"
         
-        updated_post = Post.objects.get(id=active_post.id)
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Title: '{active_post.title}' → '{updated_post.title}'")
-        print(f"[VERIFY] Content updated: {len(updated_post.content)} chars")
-        print(f"[VERIFY] Active: {active_post.active} → {updated_post.active}")
+        logger.debug("[TEST] ✓ Author reassignment drops the cached id")
+
+
+@pytest.mark.django_db
+class TestPostEditingAPI:
+    
+    def test_author_can_edit_own_post(self, auth_client, user, active_post, django_assert_num_queries):
+        update_data = {
+            'title': 'Updated Post Title',
+            'content': 'Updated post content',
+            'active': False
+        }
         
-        assert updated_post.title == 'Updated Post Title', "Post title should be updated"
-        assert updated_post.content == 'Updated post content', "Post content should be updated"  
-        assert updated_post.active == False, "Post active status should be updated"
+        logger.debug("[TEST 6] API - Edit Post (Owner)")
+        logger.debug("**PATCH** `/api/posts/%s/edit/`", active_post.id)
+        logger.debug("[AUTH] Authenticated as: %s (post owner)", user.username)
         
-        print(f"\n[SUCCESS] Post owner can edit their own posts successfully")
-    
-    def test_non_author_cannot_edit_post(self, api_client, active_post):
-        other_user = User.objects.create_user(username='other', email='other@test.com', password='pass')
-        api_client.force_authenticate(user=other_user)
+        logger.debug("Original Post:")
+        logger.debug("[ORIGINAL] Title: '%s'", active_post.title)
+        logger.debug("[ORIGINAL] Active: %s", active_post.active)
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 7: API - Edit Post (Non-Owner)")
-        print(f"{'='*60}")
-        print(f"**PATCH** `/api/posts/{active_post.id}/edit/`")
-        print(f"[SECURITY] Testing security: Non-owner access")
-        print(f"[AUTH] Authenticated as: {other_user.username}")
-        print(f"[TARGET] Target post owned by: {active_post.author.user.username}")
+        logger.debug("Request JSON:\n%s", _Pretty(update_data))
         
-        update_data = {'title': 'Hacked Title'}
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(update_data, indent=2))
-        print("```")
+        # post with author, update; the owner check compares ids without loading the user
+        with django_assert_num_queries(2):
+            response = auth_client.patch(f'/api/posts/{active_post.id}/edit/', update_data, format='json')
         
-        response = api_client.patch(f'/api/posts/{active_post.id}/edit/', update_data, format='json')
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 200 else '[FAIL]')
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 403 else '[FAIL]'}")
-        print(f"Expected: 403 Forbidden")
+        if response.status_code == status.HTTP_200_OK:
+            logger.debug("Response JSON (200 OK):\n%s", _Pretty(response.data))
+        else:
+            logger.debug("Error Response:\n%s", _Pretty(response.data))
         
-        print(f"\nResponse JSON (403 Forbidden):")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        assert response.status_code == status.HTTP_200_OK, f"Post update should succeed, got {response.status_code}: {response.data}"
         
-        assert response.status_code == status.HTTP_403_FORBIDDEN, "Non-authors should not be able to edit posts"
+        # plain values, no model instance; refresh_from_db would mutate the module-shared fixture
+        title, content, active = Post.objects.values_list('title', 'content', 'active').get(id=active_post.id)
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Title: '%s' → '%s'", active_post.title, title)
+        logger.debug("[VERIFY] Content updated: %s chars", len(content))
+        logger.debug("[VERIFY] Active: %s → %s", active_post.active, active)
         
-        unchanged_post = Post.objects.get(id=active_post.id)
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Post title unchanged: '{unchanged_post.title}' (original: '{active_post.title}')")
-        assert unchanged_post.title == active_post.title, "Post title should remain unchanged"
+        assert title == 'Updated Post Title', "Post title should be updated"
+        assert content == 'Updated post content', "Post content should be updated"  
+        assert active == False, "Post active status should be updated"
         
-        print(f"\n[SUCCESS] Non-owners correctly blocked from editing posts")
+        logger.debug("[SUCCESS] Post owner can edit their own posts successfully")
 
 
 @pytest.mark.django_db
 class TestPostDeletionAPI:
     
-    def test_author_can_delete_own_post(self, api_client, user, active_post):
-        api_client.force_authenticate(user=user)
+    def test_author_can_delete_own_post(self, auth_client, user, active_post, django_assert_num_queries):
         post_id = active_post.id
         
-        print(f"\n[TEST] Testing post deletion by owner: {user.username}")
-        print(f"[TEST] Target post: '{active_post.title}' (ID: {post_id})")
+        logger.debug("[TEST] Testing post deletion by owner: %s", user.username)
+        logger.debug("[TEST] Target post: '%s' (ID: %s)", active_post.title, post_id)
         
-        response = api_client.delete(f'/api/posts/{post_id}/delete/')
+        # post with author, comment cascade collection, delete
+        with django_assert_num_queries(3):
+            response = auth_client.delete(f'/api/posts/{post_id}/delete/')
         
-        print(f"[TEST] Post deletion API Response Status: {response.status_code}")
-        print(f"[TEST] Expected: 204 No Content")
+        logger.debug("[TEST] Post deletion API Response Status: %s", response.status_code)
+        logger.debug("[TEST] Expected: 204 No Content")
         
         assert response.status_code == status.HTTP_204_NO_CONTENT, f"Post deletion should succeed, got {response.status_code}"
         
         post_exists = Post.objects.filter(id=post_id).exists()
-        print(f"[TEST] Post still exists in database: {post_exists}")
+        logger.debug("[TEST] Post still exists in database: %s", post_exists)
         assert not post_exists, "Post should be completely removed from database"
         
-        print(f"[TEST] ✓ Post owner can delete their own posts successfully")
+        logger.debug("[TEST] ✓ Post owner can delete their own posts successfully")
+
+
+@pytest.mark.django_db
+class TestPostOwnershipAPI:
     
-    def test_non_author_cannot_delete_post(self, api_client, active_post):
-        other_user = User.objects.create_user(username='deleter', email='del@test.com', password='pass')
+    # edit and delete share the same owner check, one test covers both endpoints
+    @pytest.mark.parametrize('verb,suffix', [('patch', 'edit'), ('delete', 'delete')])
+    def test_non_author_cannot_modify_post(self, api_client, other_user, active_post, verb, suffix):
         api_client.force_authenticate(user=other_user)
         
-        print(f"\n[TEST] Testing post deletion by non-owner: {other_user.username}")
-        print(f"[TEST] Target post: '{active_post.title}' owned by {active_post.author.user.username}")
-        print(f"[TEST] Attempting unauthorized deletion...")
+        logger.debug("[TEST] %s `/api/posts/%s/%s/` as non-owner: %s", verb.upper(), active_post.id, suffix, other_user.username)
         
-        response = api_client.delete(f'/api/posts/{active_post.id}/delete/')
+        response = getattr(api_client, verb)(f'/api/posts/{active_post.id}/{suffix}/', {'title': 'Hacked Title'}, format='json')
         
-        print(f"[TEST] Unauthorized deletion API Response Status: {response.status_code}")
-        print(f"[TEST] Expected: 403 Forbidden")
+        logger.debug("Response Status: %s (expected 403 Forbidden)", response.status_code)
         
-        assert response.status_code == status.HTTP_403_FORBIDDEN, "Non-authors should not be able to delete posts"
+        assert response.status_code == status.HTTP_403_FORBIDDEN, f"Non-authors should not be able to {suffix} posts"
         
-        post_exists = Post.objects.filter(id=active_post.id).exists()
-        print(f"[TEST] Post still exists in database: {post_exists}")
-        assert post_exists, "Post should still exist in database"
+        # raises DoesNotExist if the post was deleted
+        unchanged_title = Post.objects.values_list('title', flat=True).get(id=active_post.id)
+        logger.debug("[VERIFY] Post title unchanged: '%s' (original: '%s')", unchanged_title, active_post.title)
+        assert unchanged_title == active_post.title, "Post should remain unchanged"
         
-        print(f"[TEST] ✓ Non-owners correctly blocked from deleting posts")
+        logger.debug("[SUCCESS] Non-owners correctly blocked from %s", suffix)
 
 
 @pytest.mark.django_db
 class TestCommentCreationAPI:
     
-    def test_authenticated_user_can_create_comment(self, api_client, user, active_post):
-        api_client.force_authenticate(user=user)
-        
+    def test_authenticated_user_can_create_comment(self, auth_client, user, active_post, django_assert_num_queries):
         comment_data = {
             'post': active_post.id,
             'content': 'This is a test comment from authenticated user'
         }
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 8: API - Create Comment (Authenticated)")
-        print(f"{'='*60}")
-        print(f"**POST** `/api/comments/`")
-        print(f"[AUTH] Authenticated as: {user.username}")
-        print(f"[TARGET] Target post: '{active_post.title}' (ID: {active_post.id})")
+        logger.debug("[TEST 8: API - Create Comment (Authenticated)")
+        logger.debug("**POST** `/api/comments/`")
+        logger.debug("[AUTH] Authenticated as: %s", user.username)
+        logger.debug("[TARGET] Target post: '%s' (ID: %s)", active_post.title, active_post.id)
         
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(comment_data, indent=2))
-        print("```")
+        logger.debug("Request JSON:\n%s", _Pretty(comment_data))
         
-        response = api_client.post('/api/comments/', comment_data, format='json')
+        # active post lookup during validation, then the insert
+        with django_assert_num_queries(2):
+            response = auth_client.post('/api/comments/', comment_data, format='json')
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 201 else '[FAIL]'}")
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 201 else '[FAIL]')
         
         if response.status_code == status.HTTP_201_CREATED:
-            print(f"\nResponse JSON (201 Created):")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
+            logger.debug("Response JSON (201 Created):\n%s", _Pretty(response.data))
         else:
-            print(f"\nError Response:")
-            print("```json")
-            print(json.dumps(response.data, indent=2))
-            print("```")
+            logger.debug("Error Response:\n%s", _Pretty(response.data))
         
         assert response.status_code == status.HTTP_201_CREATED, f"Comment creation should succeed, got {response.status_code}: {response.data}"
         
-        created_comment = Comment.objects.get(content=comment_data['content'])
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Comment linked to correct post: {created_comment.post == active_post}")
-        print(f"[VERIFY] Comment linked to user: {created_comment.user == user}")
-        print(f"[VERIFY] Comment approval status: {created_comment.is_approved} (should be False)")
+        # model equality is by pk, comparing the fk ids checks the same thing without joins
+        created_comment = Comment.objects.only('post', 'user', 'is_approved').get(content=comment_data['content'])
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Comment linked to correct post: %s", created_comment.post_id == active_post.id)
+        logger.debug("[VERIFY] Comment linked to user: %s", created_comment.user_id == user.id)
+        logger.debug("[VERIFY] Comment approval status: %s (should be False)", created_comment.is_approved)
         
-        assert created_comment.post == active_post, "Comment should be linked to the correct post"
-        assert created_comment.user == user, "Comment should be linked to the authenticated user"
+        assert created_comment.post_id == active_post.id, "Comment should be linked to the correct post"
+        assert created_comment.user_id == user.id, "Comment should be linked to the authenticated user"
         assert created_comment.is_approved == False, "New comments should default to unapproved"
         
-        print(f"\n[SUCCESS] Authenticated user can create comments successfully")
+        logger.debug("[SUCCESS] Authenticated user can create comments successfully")
     
     def test_anonymous_user_cannot_create_comment(self, api_client, active_post):
 
@@ -483,75 +676,283 @@ class TestCommentCreationAPI:
             'content': 'This anonymous comment should be rejected'
         }
 
-        print(f"\n{'='*60}")
-        print(f"[TEST 9: API - Create Comment (Anonymous - Should Fail)")
-        print(f"{'='*60}")
-        print(f"**POST** `/api/comments/` (No Authentication)")
-        print(f"[SECURITY] Testing security: Anonymous user access")
-        print(f"[TARGET] Target post: '{active_post.title}' (ID: {active_post.id})")
+        logger.debug("[TEST 9: API - Create Comment (Anonymous - Should Fail)")
+        logger.debug("**POST** `/api/comments/` (No Authentication)")
+        logger.debug("[SECURITY] Testing security: Anonymous user access")
+        logger.debug("[TARGET] Target post: '%s' (ID: %s)", active_post.title, active_post.id)
 
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(comment_data, indent=2))
-        print("```")
+        logger.debug("Request JSON:\n%s", _Pretty(comment_data))
 
         response = api_client.post('/api/comments/', comment_data, format='json')
 
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 403 else '[FAIL]'}")
-        print(f"Expected: 403 Forbidden")
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 403 else '[FAIL]')
+        logger.debug("Expected: 403 Forbidden")
 
-        print(f"\nResponse JSON (403 Forbidden):")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        logger.debug("Response JSON (403 Forbidden):\n%s", _Pretty(response.data))
 
         assert response.status_code == status.HTTP_403_FORBIDDEN, f"Anonymous comment creation should be forbidden, got {response.status_code}: {response.data}"
 
         comment_exists = Comment.objects.filter(content=comment_data['content']).exists()
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Comment NOT created in database: {not comment_exists}")
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Comment NOT created in database: %s", not comment_exists)
 
         assert not comment_exists, "Anonymous comment should not be created in database"
 
-        print(f"\n[SUCCESS] Anonymous users correctly blocked from creating comments")
+        logger.debug("[SUCCESS] Anonymous users correctly blocked from creating comments")
     
-    def test_cannot_comment_on_inactive_post(self, api_client, user, inactive_post):
-        api_client.force_authenticate(user=user)
-        
+    def test_cannot_comment_on_inactive_post(self, auth_client, user, posts):
         comment_data = {
-            'post': inactive_post.id,
+            'post': posts.inactive.id,
             'content': 'This comment should fail'
         }
         
-        print(f"\n{'='*60}")
-        print(f"[TEST 10: API - Validation Error (Inactive Post)")
-        print(f"{'='*60}")
-        print(f"**POST** `/api/comments/`")
-        print(f"[SECURITY] Testing validation: Comment on inactive post")
-        print(f"[AUTH] Authenticated as: {user.username}")
-        print(f"[TARGET] Target post: '{inactive_post.title}' (active: {inactive_post.active})")
+        logger.debug("[TEST 10: API - Validation Error (Inactive Post)")
+        logger.debug("**POST** `/api/comments/`")
+        logger.debug("[SECURITY] Testing validation: Comment on inactive post")
+        logger.debug("[AUTH] Authenticated as: %s", user.username)
+        logger.debug("[TARGET] Target post: '%s' (active: %s)", posts.inactive.title, posts.inactive.active)
         
-        print(f"\nRequest JSON:")
-        print("```json")
-        print(json.dumps(comment_data, indent=2))
-        print("```")
+        logger.debug("Request JSON:\n%s", _Pretty(comment_data))
         
-        response = api_client.post('/api/comments/', comment_data, format='json')
+        response = auth_client.post('/api/comments/', comment_data, format='json')
         
-        print(f"\nResponse Status: {response.status_code} {'[PASS]' if response.status_code == 400 else '[FAIL]'}")
-        print(f"Expected: 400 Bad Request")
+        logger.debug("Response Status: %s %s", response.status_code, '[PASS]' if response.status_code == 400 else '[FAIL]')
+        logger.debug("Expected: 400 Bad Request")
         
-        print(f"\nResponse JSON (400 Bad Request):")
-        print("```json")
-        print(json.dumps(response.data, indent=2))
-        print("```")
+        logger.debug("Response JSON (400 Bad Request):\n%s", _Pretty(response.data))
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST, "Comment creation on inactive post should fail"
         assert 'Comments can only be created on active posts' in str(response.data), "Should provide helpful error message"
         
         comment_exists = Comment.objects.filter(content=comment_data['content']).exists()
-        print(f"\n[DATABASE] Database Verification:")
-        print(f"[VERIFY] Comment NOT created in database: {not comment_exists}")
+        logger.debug("[DATABASE] Database Verification:")
+        logger.debug("[VERIFY] Comment NOT created in database: %s", not comment_exists)
         assert not comment_exists, "Comment should not be created on inactive post"
         
-        print(f"\n[SUCCESS] Users correctly blocked from commenting on inactive posts")
\ No newline at end of file
+        logger.debug("[SUCCESS] Users correctly blocked from commenting on inactive posts")
+
+
+@pytest.mark.django_db
+class TestPostDetailAPI:
+    
+    def test_api_post_detail_loads_comments_without_n_plus_one(self, api_client, user, active_post, django_assert_num_queries):
+        for i in range(3):
+            Comment.objects.create(post=active_post, user=user, content=f'Comment {i}', is_approved=True)
+        Comment.objects.create(post=active_post, content='Anonymous comment')
+        
+        logger.debug("[TEST] Fetching post detail with %s comments", active_post.comments.count())
+        
+        # one query for post + author, one for comments with annotated usernames
+        with django_assert_num_queries(2):
+            response = api_client.get(f'/api/posts/{active_post.id}/')
+        
+        logger.debug("[TEST] Post detail API Response Status: %s", response.status_code)
+        
+        assert response.status_code == status.HTTP_200_OK, "Post detail should load successfully"
+        data = response.data
+        comments = data['comments']
+        assert data['author_name'] == active_post.author.name, "Author name should be included"
+        assert data['status'] == 'published', "Status should be returned by name"
+        assert len(comments) == 4, "All comments should be included"
+        assert data['approved_comment_count'] == 3, "Only approved comments should be counted"
+        
+        user_names = {comment['content']: comment['user_name'] for comment in comments}
+        assert user_names['Comment 0'] == user.username, "Comment username should be included"
+        assert user_names['Anonymous comment'] == 'Anonymous', "Comments without a user should show Anonymous"
+        
+        logger.debug("[TEST] ✓ Post detail loads author and comments in constant queries")
+    
+    def test_api_post_detail_conditional_get(self, api_client, user, active_post, django_assert_num_queries):
+        url = f'/api/posts/{active_post.id}/'
+        etag = api_client.get(url)['ETag']
+        
+        with django_assert_num_queries(0):
+            not_modified = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        logger.debug("[TEST] Conditional GET with %s: %s", etag, not_modified.status_code)
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED, "Unchanged post should return 304"
+        
+        Comment.objects.create(post=active_post, user=user, content='New comment')
+        changed = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        assert changed.status_code == status.HTTP_200_OK, "A new comment should change the etag"
+        assert changed['ETag'] != etag, "Response should carry the new etag"
+        
+        logger.debug("[TEST] ✓ Detail endpoint answers conditional GETs")
+    
+    def test_api_post_detail_etag_expires_after_unsignalled_write(self, api_client, active_post, monkeypatch):
+        url = f'/api/posts/{active_post.id}/'
+        etag = api_client.get(url)['ETag']
+        
+        # queryset.update() fires no signals, like a write made by another process
+        Post.objects.filter(pk=active_post.pk).update(title='Renamed Elsewhere')
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        
+        later = time.time() + settings.POST_CACHE_TIMEOUT + 1
+        monkeypatch.setattr(locmem, 'time', SimpleNamespace(time=lambda: later))
+        expired = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        assert expired.status_code == status.HTTP_200_OK, "Etag should change once the cache version expires"
+        assert expired.json()['title'] == 'Renamed Elsewhere', "Response should carry the updated post"
+        
+        logger.debug("[TEST] ✓ Etags heal after writes the signals never saw")
+    
+    def test_api_post_detail_fields_param_skips_unrequested_relations(self, api_client, user, active_post, django_assert_num_queries):
+        Comment.objects.create(post=active_post, user=user, content='Skipped comment')
+        
+        # no author join and no comments prefetch, just the post row
+        with django_assert_num_queries(1):
+            response = api_client.get(f'/api/posts/{active_post.id}/?fields=title')
+        
+        logger.debug("[TEST] Limited detail response: %s", response.json())
+        
+        assert response.status_code == status.HTTP_200_OK, "Limited post detail should load successfully"
+        assert response.json() == {'id': active_post.id, 'title': active_post.title}, "Only requested fields and id should be returned"
+        
+        with django_assert_num_queries(2):
+            response = api_client.get(f'/api/posts/{active_post.id}/?fields=comments')
+        
+        assert [comment['content'] for comment in response.json()['comments']] == ['Skipped comment'], "Requested comments should be prefetched"
+        
+        # the count is annotated onto the post query, no comment rows are loaded
+        with django_assert_num_queries(1):
+            response = api_client.get(f'/api/posts/{active_post.id}/?fields=approved_comment_count')
+        
+        assert response.json()['approved_comment_count'] == 0, "Unapproved comments should not be counted"
+        
+        logger.debug("[TEST] ✓ fields param limits response and eager loading")
+    
+    def test_api_post_detail_unknown_fields_do_not_grow_lookup_cache(self, api_client, active_post):
+        url = f'/api/posts/{active_post.id}/'
+        api_client.get(f'{url}?fields=title')
+        cached = related_lookups.cache_info().currsize
+        
+        for i in range(20):
+            response = api_client.get(f'{url}?fields=title,junk{i}')
+            assert response.json() == {'id': active_post.id, 'title': active_post.title}, "Unknown fields should be ignored"
+        
+        logger.debug("[TEST] Lookup cache size: %s -> %s", cached, related_lookups.cache_info().currsize)
+        assert related_lookups.cache_info().currsize == cached, "Unknown field names should not add cache entries"
+        
+        logger.debug("[TEST] ✓ fields param can't grow the lookup cache")
+
+
+class TestAutoPrefetch:
+    
+    def test_related_lookups_follow_serializer_sources(self):
+        list_lookups = related_lookups(PostListSerializer, Post)
+        detail_lookups = related_lookups(PostDetailSerializer, Post)
+        comment_lookups = related_lookups(CommentSerializer, Comment)
+        
+        logger.debug("[TEST] list=%s detail=%s comment=%s", list_lookups, detail_lookups, comment_lookups)
+        
+        assert list_lookups == (('author',), ()), "author.name should join the author"
+        assert detail_lookups == (('author',), ('comments',)), "Nested comments should be prefetched"
+        assert comment_lookups == ((), ()), "Primary key and annotated fields should not join anything"
+        
+        logger.debug("[TEST] ✓ Related lookups derived from serializer fields")
+
+
+class TestCachedSerializerFields:
+    
+    def test_cached_fields_are_not_shared_between_instances(self):
+        first = PostListSerializer().fields
+        second = PostListSerializer().fields
+        
+        logger.debug("[TEST] PostListSerializer fields: %s", list(first.keys()))
+        
+        assert list(first.keys()) == list(second.keys()), "Cached field set should be reused"
+        assert first['author_name'] is not second['author_name'], "Each instance should bind its own field copies"
+        assert first['author_name'].parent is not second['author_name'].parent, "Field copies should be bound to their own serializer"
+        assert second['author_name'].source_attrs == ['author', 'name'], "Bound copies should resolve their source"
+        
+        logger.debug("[TEST] ✓ Serializer field set cached per class, bound per instance")
+
+
+@pytest.mark.django_db
+class TestPostModel:
+    
+    def test_invalid_status_rejected_by_database(self, author):
+        logger.debug("[TEST] Bulk inserting post with invalid status")
+        
+        with pytest.raises(IntegrityError):
+            Post.objects.bulk_create([Post(title='Bad Status', content='Invalid', author=author, status=9)])
+        
+        logger.debug("[TEST] ✓ Database rejects unknown status values")
+
+
+@pytest.mark.django_db
+class TestCommentModel:
+    
+    def test_comment_str_does_not_query_unloaded_relations(self, user, active_post, django_assert_num_queries):
+        comment = Comment.objects.create(post=active_post, user=user, content='String test')
+        
+        unloaded = Comment.objects.get(pk=comment.pk)
+        with django_assert_num_queries(0):
+            unloaded_str = str(unloaded)
+        
+        loaded = Comment.objects.select_related('post', 'user').get(pk=comment.pk)
+        
+        logger.debug("[TEST] Unloaded: %s", unloaded_str)
+        logger.debug("[TEST] Loaded: %s", loaded)
+        
+        assert unloaded_str == f'Comment on "#{active_post.pk}" by user #{user.pk}', "Unloaded relations should fall back to ids"
+        assert str(loaded) == f'Comment on "{active_post.title}" by {user.username}', "Loaded relations should be used"
+        
+        logger.debug("[TEST] ✓ Comment string representation never triggers queries")
+
+
+@pytest.mark.django_db
+class TestCreateDemoDataCommand:
+    
+    def test_second_run_creates_nothing(self):
+        call_command('create_demo_data', stdout=StringIO())
+        counts = {model.__name__: model.objects.count() for model in (User, Author, Post, Comment)}
+        
+        output = StringIO()
+        call_command('create_demo_data', stdout=output)
+        
+        logger.debug("[TEST] Counts after first run: %s", counts)
+        assert {model.__name__: model.objects.count() for model in (User, Author, Post, Comment)} == counts, "Re-running should not insert rows"
+        assert 'already present' in output.getvalue(), "Second run should report the data as present"
+        
+        demo_posts = Post.objects.filter(title__in=DEMO_POST_TITLES)
+        assert demo_posts.count() == 3, "Each demo post should exist once"
+        assert Comment.objects.filter(post__in=demo_posts).count() == 4, "Each demo comment should exist once"
+        for username in DEMO_USERNAMES:
+            assert Author.objects.filter(user__username=username).count() == 1, f"{username} should have exactly one author"
+        
+        logger.debug("[TEST] ✓ Demo seeding is idempotent")
+    
+    def test_existing_author_is_reused(self):
+        admin = User.objects.create(username='admin', email='admin@example.com')
+        existing = Author.objects.create(user=admin, name='Site Admin', email='site-admin@example.com')
+        
+        call_command('create_demo_data', stdout=StringIO())
+        
+        assert Author.objects.filter(user=admin).count() == 1, "A user's existing author should not be duplicated"
+        assert Post.objects.filter(title__in=DEMO_POST_TITLES, author=existing).count() == 2, "Admin's demo posts should use the existing author"
+        
+        logger.debug("[TEST] ✓ Demo seeding reuses a user's existing author")
+
+
+class TestORJSONRenderer:
+    
+    def test_renderer_falls_back_to_drf_encoder(self):
+        rendered = ORJSONRenderer().render({'label': gettext_lazy('Draft'), 'amount': Decimal('1.50')})
+        
+        logger.debug("[TEST] Rendered: %s", rendered)
+        
+        assert json.loads(rendered) == {'label': 'Draft', 'amount': 1.5}, "Unsupported types should use DRF's encoder"
+        
+        logger.debug("[TEST] ✓ orjson renderer handles lazy strings and decimals")
+    
+    # project/test_settings.py drops the browsable renderer, html requests never reach a template
+    def test_api_serves_only_json_in_tests(self, api_client):
+        response = api_client.get('/api/posts/', HTTP_ACCEPT='text/html')
+        
+        logger.debug("[TEST] text/html request: %s", response.status_code)
+        
+        assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE, "Only the json renderer should be configured"
+        
+        logger.debug("[TEST] ✓ Tests run with the json-only renderer")
@@ -12,7 +12,7 @@ urlpatterns = [
     path('post/<int:pk>/delete/', views.PostDeleteView.as_view(), name='post_delete'),
     
     # REST API Endpoints
-    path('api/posts/', views.PostListCreateAPIView.as_view(), name='api_post_list_create'),
+    path('api/posts/', views.post_list_create, name='api_post_list_create'),
     path('api/posts/<int:pk>/', views.PostDetailAPIView.as_view(), name='api_post_detail'),
     path('api/posts/<int:pk>/edit/', views.PostUpdateAPIView.as_view(), name='api_post_update'),
     path('api/posts/<int:pk>/delete/', views.PostDeleteAPIView.as_view(), name='api_post_delete'),
@@ -1,20 +1,33 @@
+import functools
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.http import HttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 
-from rest_framework import generics, permissions, filters, status
+from rest_framework import generics, permissions, filters, serializers, status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
-from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.permissions import IsAuthenticated
 
+from .cache import author_cache_key, posts_cache_key, posts_etag
 from .models import Post, Comment, Author
 from .serializers import (
     PostListSerializer, PostDetailSerializer, PostCreateSerializer,
     PostUpdateSerializer, CommentCreateSerializer
 )
-from .filters import PostFilter
+from .filters import PostFilterBackend
+from .pagination import PostPagination
 
 
 # Django Class-Based Views
@@ -26,7 +39,22 @@ class PostListView(ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        return Post.objects.filter(active=True, status='published').select_related('author').prefetch_related('comments__user')
+        return Post.objects.active_published().with_author().prefetch_related('comments__user')
+
+    # the page is identical for every anonymous visitor, serve it from cache until posts change
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        key = posts_cache_key('page', request.get_full_path())
+        content = cache.get(key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        cache.set(key, response.content, settings.POST_CACHE_TIMEOUT)
+        return response
 
 
 # individual post pages, single post with author info
@@ -36,7 +64,7 @@ class PostDetailView(DetailView):
     context_object_name = 'post'
     
     def get_queryset(self):
-        return Post.objects.filter(active=True, status='published').select_related('author')
+        return Post.objects.active_published().with_author()
 
 
 # lets authenticated users create posts, auto creates author profile
@@ -46,16 +74,25 @@ class PostCreateView(LoginRequiredMixin, CreateView):
     fields = ['title', 'content', 'published_date']
     success_url = reverse_lazy('blog:post_list')
     
+    # published_date defaults in the database, prefill the form with the current time
+    def get_initial(self):
+        return {'published_date': timezone.now()}
+    
     def form_valid(self, form):
-        # Ensure user has an Author profile
-        author, created = Author.objects.get_or_create(
-            user=self.request.user,
-            defaults={
-                'name': self.request.user.get_full_name() or self.request.user.username,
-                'email': self.request.user.email
-            }
-        )
-        form.instance.author = author
+        # Ensure user has an Author profile, its id is cached so repeat posts skip the lookup
+        key = author_cache_key(self.request.user.id)
+        author_id = cache.get(key)
+        if author_id is None:
+            author, created = Author.objects.get_or_create(
+                user=self.request.user,
+                defaults={
+                    'name': self.request.user.get_full_name() or self.request.user.username,
+                    'email': self.request.user.email
+                }
+            )
+            author_id = author.id
+            cache.set(key, author_id, settings.AUTHOR_CACHE_TIMEOUT)
+        form.instance.author_id = author_id
         return super().form_valid(form)
 
 
@@ -68,10 +105,10 @@ class PostEditView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
 
     def test_func(self):
         post = self.get_object()
-        return post.author.user == self.request.user
+        return post.author.user_id == self.request.user.id
 
     def get_queryset(self):
-        return Post.objects.all().select_related('author')
+        return Post.objects.with_author()
 
 
 # allows authenticated users to delete their own posts only
@@ -82,10 +119,10 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 
     def test_func(self):
         post = self.get_object()
-        return post.author.user == self.request.user
+        return post.author.user_id == self.request.user.id
 
     def get_queryset(self):
-        return Post.objects.all().select_related('author')
+        return Post.objects.with_author()
 
 
 # ensures only post owners can edit/delete their content, checks author.user match
@@ -94,48 +131,170 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         # Read permissions for any request
         if request.method in permissions.SAFE_METHODS:
             return True
-        # Write permissions only to the owner
-        return obj.author.user == request.user
+        # Write permissions only to the owner, compared by id so the user row is never loaded
+        return obj.author.user_id == request.user.id
+
+
+# collects the related lookups a serializer's readable fields traverse, FK/one-to-one hops
+# become select_related and anything past a reverse FK or M2M becomes prefetch_related
+# fields limits the walk to those top-level field names, None means every field
+@functools.lru_cache(maxsize=None)
+def related_lookups(serializer_class, model, fields=None):
+    select, prefetch = set(), set()
+    _collect_related_lookups(serializer_class(), model, '', False, select, prefetch, fields)
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+def _collect_related_lookups(serializer, model, prefix, many, select, prefetch, fields=None):
+    for name, field in serializer.fields.items():
+        if field.write_only or field.source == '*':
+            continue
+        if fields is not None and name not in fields:
+            continue
+        
+        parts = field.source.split('.')
+        # primary key fields read the local <name>_id column, the related row is never loaded
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            parts = parts[:-1]
+        
+        current, path, to_many = model, prefix, many
+        for part in parts:
+            try:
+                model_field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                # annotations and properties, nothing to join
+                break
+            if not model_field.is_relation:
+                break
+            path = f'{path}__{part}' if path else part
+            to_many = to_many or model_field.one_to_many or model_field.many_to_many
+            (prefetch if to_many else select).add(path)
+            current = model_field.related_model
+        else:
+            nested = getattr(field, 'child', field)
+            if parts and isinstance(nested, serializers.ModelSerializer):
+                _collect_related_lookups(nested, current, path, to_many, select, prefetch)
+
+
+# joins/prefetches whatever the view's serializer reads so new related fields don't
+# silently add per-row queries, lookups the view already prefetches with a custom queryset win
+# serializers with a setup_eager_loading hook get to add their custom prefetches first
+class AutoPrefetchMixin:
+    # top-level field names the response will render, None renders everything
+    def get_requested_fields(self):
+        return None
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        fields = self.get_requested_fields()
+        
+        setup_eager_loading = getattr(serializer_class, 'setup_eager_loading', None)
+        if setup_eager_loading is not None:
+            queryset = setup_eager_loading(queryset, fields)
+        
+        select, prefetch = related_lookups(serializer_class, queryset.model, fields)
+        
+        custom = [getattr(lookup, 'prefetch_to', lookup) for lookup in queryset._prefetch_related_lookups]
+        prefetch = [
+            lookup for lookup in prefetch
+            if not any(lookup == seen or lookup.startswith(f'{seen}__') for seen in custom)
+        ]
+        
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
 
 
 # REST API Views
-# /api/posts/ endpoint for listing and creating posts, supports filtering and search
-class PostListCreateAPIView(generics.ListCreateAPIView):
-    permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_class = PostFilter
+# GET /api/posts/ read path, supports filtering and search
+@method_decorator([vary_on_headers('Accept', 'Cookie'), condition(etag_func=posts_etag)], name='dispatch')
+class PostListAPIView(AutoPrefetchMixin, generics.ListAPIView):
+    serializer_class = PostListSerializer
+    # only load the columns PostListSerializer reads, the author join comes from AutoPrefetchMixin
+    queryset = Post.objects.filter(active=True).only(
+        'id', 'title', 'content', 'published_date', 'author__name'
+    )
+    permission_classes = [permissions.AllowAny]
+    filter_backends = [PostFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = PostPagination
     search_fields = ['title', 'author__name']
     ordering_fields = ['published_date', 'title']
     ordering = ['-published_date']
     
-    def get_queryset(self):
-        return Post.objects.filter(active=True).select_related('author')
-    
-    def get_serializer_class(self):
-        if self.request.method == 'POST':
-            return PostCreateSerializer
-        return PostListSerializer
+    # anonymous list responses are the same for every reader, cache the data until posts change
+    # query params are sorted so ?a=1&b=2 and ?b=2&a=1 share an entry, the host is part of the key
+    # because the next/previous page links are absolute urls
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        key = posts_cache_key('api', f'{request.get_host()}{request.path}?{query}')
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, settings.POST_CACHE_TIMEOUT)
+        return response
     
-    def perform_create(self, serializer):
-        serializer.save()
+    # a bare list request has nothing to filter or search, only apply the default ordering
+    def filter_queryset(self, queryset):
+        if not self.request.query_params:
+            return filters.OrderingFilter().filter_queryset(self.request, queryset, self)
+        return super().filter_queryset(queryset)
+
+
+# POST /api/posts/ write path, creates the author on first post
+class PostCreateAPIView(generics.CreateAPIView):
+    serializer_class = PostCreateSerializer
+    permission_classes = [IsAuthenticated]
+
+
+_post_list_view = PostListAPIView.as_view()
+_post_create_view = PostCreateAPIView.as_view()
+
+
+# /api/posts/ sends POST to the create view and every other method to the list view,
+# csrf is checked by DRF's session authentication inside each view
+@csrf_exempt
+def post_list_create(request, *args, **kwargs):
+    view = _post_create_view if request.method == 'POST' else _post_list_view
+    return view(request, *args, **kwargs)
 
 
 # serves individual post with comments included, full detail view
-class PostDetailAPIView(generics.RetrieveAPIView):
+# ?fields=title,comments limits the response, and the joins and prefetches, to those fields
+@method_decorator([vary_on_headers('Accept', 'Cookie'), condition(etag_func=posts_etag)], name='dispatch')
+class PostDetailAPIView(AutoPrefetchMixin, generics.RetrieveAPIView):
     serializer_class = PostDetailSerializer
+    queryset = Post.objects.filter(active=True)
     permission_classes = [permissions.AllowAny]
     
-    def get_queryset(self):
-        return Post.objects.filter(active=True).select_related('author').prefetch_related('comments__user')
+    # unknown names are dropped before they reach the lru-cached related_lookups, so the
+    # cache holds at most one entry per subset of the serializer's fields
+    def get_requested_fields(self):
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        known = self.get_serializer_class().Meta.fields
+        return tuple(sorted({'id', *set(known).intersection(fields.split(','))}))
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
 
 
 # API post editing, owner only updates title/content/active
-class PostUpdateAPIView(generics.UpdateAPIView):
+class PostUpdateAPIView(AutoPrefetchMixin, generics.UpdateAPIView):
     serializer_class = PostUpdateSerializer
+    # the owner check reads post.author, which the serializer itself never touches
+    queryset = Post.objects.with_author()
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
-    
-    def get_queryset(self):
-        return Post.objects.all().select_related('author')
 
 
 # API post deletion, owner only removes entire post
@@ -143,7 +302,7 @@ class PostDeleteAPIView(generics.DestroyAPIView):
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     
     def get_queryset(self):
-        return Post.objects.all().select_related('author')
+        return Post.objects.with_author()
 
 
 # processes comment submissions via API, requires authentication
@@ -0,0 +1,28 @@
+# settings used by the test suite, see pytest.ini
+from .settings import *  # noqa: F401,F403
+
+
+# tests never touch the on-disk db.sqlite3, the test database lives in memory
+# and is shared between connections in the same process
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': 'file:blog_test?mode=memory&cache=shared',
+        },
+    }
+}
+
+# password hashing isn't under test, MD5 keeps create_user calls cheap
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# api tests only ever ask for json, skip the browsable renderer and form/multipart parsers
+# DRF reads these when the view classes are defined, so they have to be set here rather than per test
+# the rest of the api config (permissions, filters, pagination) stays as in production
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    'DEFAULT_RENDERER_CLASSES': ['blog.renderers.ORJSONRenderer'],
+    'DEFAULT_PARSER_CLASSES': ['rest_framework.parsers.JSONParser'],
+    'DEFAULT_THROTTLE_CLASSES': [],
+}